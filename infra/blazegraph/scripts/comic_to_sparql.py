@@ -16,15 +16,111 @@ Updated to utilize new ontology properties:
 - Universe: universeName, designation, universeDescription
 """
 
+import io
 import json
+import multiprocessing
+import os
+import re
 import sys
+from functools import lru_cache, partial
+from itertools import islice
 from urllib.parse import quote
-from typing import TextIO, Iterator
+from typing import BinaryIO, Iterator
+
+try:
+    import ijson
+except ImportError:  # Fall back to the pure-Python scanner below
+    ijson = None
 
 # Ontology namespace
 NAMESPACE = "http://knowledge.graph/ontology/narrative#"
 BASE_URI = "http://knowledge.graph/data/"
 
+# Supported output formats: SPARQL UPDATE script or plain N-Triples
+OUTPUT_FORMATS = ("sparql", "nt")
+
+# Vocabulary IRIs, built once instead of on every f-string evaluation.
+# rdf:type is spelled out instead of the SPARQL/Turtle "a" keyword so that
+# every emitted triple is also a valid N-Triples statement.
+_RDF_TYPE = "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>"
+_RDFS_LABEL = "<http://www.w3.org/2000/01/rdf-schema#label>"
+
+_XSD_INT = "^^<http://www.w3.org/2001/XMLSchema#int>"
+_XSD_DATE = "^^<http://www.w3.org/2001/XMLSchema#date>"
+_XSD_DECIMAL = "^^<http://www.w3.org/2001/XMLSchema#decimal>"
+_XSD_FLOAT = "^^<http://www.w3.org/2001/XMLSchema#float>"
+_XSD_ANYURI = "^^<http://www.w3.org/2001/XMLSchema#anyURI>"
+
+# Closing quote, datatype and terminator of typed literals, so triple lines
+# only interpolate their variable parts
+_INT_LITERAL_END = f'"{_XSD_INT} .\n'
+_FLOAT_LITERAL_END = f'"{_XSD_FLOAT} .\n'
+
+# Ontology classes
+_C_CHARACTER = f"<{NAMESPACE}Character>"
+_C_CREDIT_RELATIONSHIP = f"<{NAMESPACE}CreditRelationship>"
+_C_FORMAT_CLASS = f"<{NAMESPACE}FormatClass>"
+_C_GENRE = f"<{NAMESPACE}Genre>"
+_C_GROUP = f"<{NAMESPACE}Group>"
+_C_MANIFESTATION = f"<{NAMESPACE}Manifestation>"
+_C_ORG = f"<{NAMESPACE}Org>"
+_C_PERSON = f"<{NAMESPACE}Person>"
+_C_STORY_EXPRESSION = f"<{NAMESPACE}StoryExpression>"
+_C_STORY_WORK = f"<{NAMESPACE}StoryWork>"
+_C_TAG = f"<{NAMESPACE}Tag>"
+_C_THEME = f"<{NAMESPACE}Theme>"
+_C_TONE = f"<{NAMESPACE}Tone>"
+_C_UNIVERSE = f"<{NAMESPACE}Universe>"
+
+# Ontology properties
+_P_ALIASES = f"<{NAMESPACE}aliases>"
+_P_BELONGS_TO_FRANCHISE = f"<{NAMESPACE}belongsToFranchise>"
+_P_BILLING_ORDER = f"<{NAMESPACE}billingOrder>"
+_P_CHARACTER_NAME = f"<{NAMESPACE}characterName>"
+_P_COMPLETION_RATE = f"<{NAMESPACE}completionRate>"
+_P_CREDITED_NAME = f"<{NAMESPACE}creditedName>"
+_P_CREDIT_ROLE = f"<{NAMESPACE}creditRole>"
+_P_CREDITS_EXPRESSION = f"<{NAMESPACE}creditsExpression>"
+_P_DESIGNATION = f"<{NAMESPACE}designation>"
+_P_ENGAGEMENT_SCORE = f"<{NAMESPACE}engagementScore>"
+_P_EXPRESSION_OF = f"<{NAMESPACE}expressionOf>"
+_P_FIRST_APPEARANCE = f"<{NAMESPACE}firstAppearance>"
+_P_FIRST_APPEARANCE_IN = f"<{NAMESPACE}firstAppearanceIn>"
+_P_GENRE = f"<{NAMESPACE}genre>"
+_P_GROUP_NAME = f"<{NAMESPACE}groupName>"
+_P_GROUP_TYPE = f"<{NAMESPACE}groupType>"
+_P_HAS_CREDIT_RELATIONSHIP = f"<{NAMESPACE}hasCreditRelationship>"
+_P_HAS_EXPRESSION = f"<{NAMESPACE}hasExpression>"
+_P_HAS_FORMAT_CLASS = f"<{NAMESPACE}hasFormatClass>"
+_P_HAS_GENRE = f"<{NAMESPACE}hasGenre>"
+_P_HAS_MANIFESTATION = f"<{NAMESPACE}hasManifestation>"
+_P_HAS_THEME = f"<{NAMESPACE}hasTheme>"
+_P_HAS_TONE = f"<{NAMESPACE}hasTone>"
+_P_KNOWN_AS = f"<{NAMESPACE}knownAs>"
+_P_LEGAL_NAME = f"<{NAMESPACE}legalName>"
+_P_MANIFESTATION_OF = f"<{NAMESPACE}manifestationOf>"
+_P_ORG_TYPE = f"<{NAMESPACE}orgType>"
+_P_POPULARITY_SCORE = f"<{NAMESPACE}popularityScore>"
+_P_PUBLISHED_BY = f"<{NAMESPACE}publishedBy>"
+_P_SERIES_NAME = f"<{NAMESPACE}seriesName>"
+_P_SERIES_TYPE = f"<{NAMESPACE}seriesType>"
+_P_TRENDING_SCORE = f"<{NAMESPACE}trendingScore>"
+_P_UNIVERSE_NAME = f"<{NAMESPACE}universeName>"
+# roleName has always been emitted under the data namespace
+_P_ROLE_NAME = f"<{BASE_URI}roleName>"
+
+# Block size for binary reads of the input file
+READ_CHUNK_SIZE = 64 * 1024
+
+# Bytes that can change the fallback JSON scanner's state
+_JSON_STRUCTURAL = re.compile(rb'[{}"\\]')
+
+# Output buffer size, so blocks are flushed to disk in large writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Issues handed to each worker process at a time, amortizing pickling overhead
+POOL_CHUNK_SIZE = 64
+
 # Prefix declarations for SPARQL output
 PREFIXES = """PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
 PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
@@ -39,95 +135,189 @@ PREFIX data: <http://knowledge.graph/data/>
 
 """
 
-
+# Names, genres, tones and format classes repeat across thousands of issues;
+# typed=True keeps e.g. 1 and True from sharing a cache entry.
+@lru_cache(maxsize=100_000, typed=True)
 def safe_uri(s: str) -> str:
     """Convert string to safe URI component"""
+    # No pre-check for already-safe text: quote() returns it after one C-level bytes.rstrip
     return quote(str(s).replace(" ", "_").replace("/", "_").replace(":", "_"), safe='')
 
+def _escape_literal(s: str) -> str:
+    """Backslash-escape quotes, backslashes and line breaks for a SPARQL literal"""
+    return s.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
+
+@lru_cache(maxsize=100_000, typed=True)
 def escape_sparql_string(s: str) -> str:
     """Escape string for SPARQL literal"""
     if s is None:
         return ""
-    return str(s).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
+    return _escape_literal(str(s))
+
+def escape_sparql_text(s: str, limit: int) -> str:
+    """Truncate and escape long free text for SPARQL literal (uncached, as it rarely repeats)"""
+    return _escape_literal(s[:limit])
+
+# Literal kinds used by the field schemas: kind -> (escape value, datatype suffix)
+_LITERAL_KINDS = {
+    "str": (True, ""),
+    "int": (False, _XSD_INT),
+    "date": (False, _XSD_DATE),
+    "decimal": (False, _XSD_DECIMAL),
+    "anyURI": (True, _XSD_ANYURI),
+}
+
+def _compile_fields(schema: list[tuple]) -> tuple[tuple, ...]:
+    """Resolve (key, property, kind[, max length]) rows into ready-to-format field specs"""
+    fields = []
+    for key, prop, kind, *limit in schema:
+        escape, suffix = _LITERAL_KINDS[kind]
+        # Everything between the subject and the value, and everything after the value
+        head = f' <{NAMESPACE}{prop}> "'
+        tail = f'"{suffix} .\n'
+        fields.append((key, head, escape, limit[0] if limit else None, tail))
+    return tuple(fields)
+
+def generate_literal_triples(buf: io.StringIO, subject: str, data: dict, fields: tuple[tuple, ...]) -> None:
+    """Generate one literal triple per populated field of a compiled schema"""
+    for key, head, escape, limit, tail in fields:
+        value = data.get(key)
+        if value:
+            if limit:
+                value = escape_sparql_text(value, limit)
+            elif escape:
+                value = escape_sparql_string(value)
+            buf.write(f'{subject}{head}{value}{tail}')
 
-def generate_person_triples(creator_id: int, creator_name: str) -> list[str]:
+# Optional literal fields per entity type: (JSON key, ontology property, kind[, max length])
+SERIES_FIELDS = _compile_fields([
+    ("sort_name", "sortName", "str"),
+    ("volume", "volume", "int"),
+    ("year_began", "yearBegan", "int"),
+    ("year_ended", "yearEnded", "int"),
+    ("count_of_issues", "issueCount", "int"),
+    ("desc", "synopsis", "str", 1000),
+])
+
+ISSUE_FIELDS = _compile_fields([
+    ("issue_name", "issueTitle", "str"),
+    ("number", "issueNumber", "str"),
+    ("cover_date", "coverDate", "date"),
+    ("store_date", "storeDate", "date"),
+    ("price", "msrp", "decimal"),
+    ("page_count", "pageCount", "int"),
+    ("desc", "description", "str", 1000),
+    ("sku", "sku", "str"),
+    ("upc", "upc", "str"),
+    ("image", "coverImage", "anyURI"),
+    ("isbn", "isbn", "str"),
+])
+
+CHARACTER_FIELDS = _compile_fields([
+    ("real_name", "realName", "str"),
+    ("origin", "origin", "str", 500),
+    ("powers", "powers", "str", 1000),
+    ("desc", "bio", "str", 1000),
+])
+
+GROUP_FIELDS = _compile_fields([
+    ("desc", "purpose", "str", 1000),
+])
+
+UNIVERSE_FIELDS = _compile_fields([
+    ("desc", "universeDescription", "str", 1000),
+])
+
+# Shared entities (people, orgs, genres, tones, themes, format classes, tags)
+# whose descriptive triples have already been written by this process. Links
+# from works and issues to them are always written. Each worker process of a
+# --jobs run keeps its own set, so an entity is written at most once per worker.
+_EMITTED_ENTITIES: set[str] = set()
+
+def _first_emission(key: str) -> bool:
+    """Record an entity as written, returning True only the first time it is seen"""
+    if key in _EMITTED_ENTITIES:
+        return False
+    _EMITTED_ENTITIES.add(key)
+    return True
+
+def generate_person_triples(buf: io.StringIO, creator_id: int, creator_name: str) -> None:
     """Generate triples for a Person (creator)"""
     person_uri = f"<{BASE_URI}person/{creator_id}>"
-    triples = [
-        f'{person_uri} a <{NAMESPACE}Person> .',
-        f'{person_uri} <http://www.w3.org/2000/01/rdf-schema#label> "{escape_sparql_string(creator_name)}" .',
-        f'{person_uri} <{NAMESPACE}knownAs> "{escape_sparql_string(creator_name)}" .'
-    ]
-    return triples
-
-def generate_org_triples(org_id: int, org_name: str, org_type: str = "Publisher") -> list[str]:
+    if not _first_emission(person_uri):
+        return
+    buf.write(f'{person_uri} {_RDF_TYPE} {_C_PERSON} .\n')
+    buf.write(f'{person_uri} {_RDFS_LABEL} "{escape_sparql_string(creator_name)}" .\n')
+    buf.write(f'{person_uri} {_P_KNOWN_AS} "{escape_sparql_string(creator_name)}" .\n')
+
+def generate_org_triples(buf: io.StringIO, org_id: int, org_name: str, org_type: str = "Publisher") -> None:
     """Generate triples for an Organization (publisher/imprint)"""
     org_uri = f"<{BASE_URI}org/{org_id}>"
-    triples = [
-        f'{org_uri} a <{NAMESPACE}Org> .',
-        f'{org_uri} <http://www.w3.org/2000/01/rdf-schema#label> "{escape_sparql_string(org_name)}" .',
-        f'{org_uri} <{NAMESPACE}legalName> "{escape_sparql_string(org_name)}" .',
-        f'{org_uri} <{NAMESPACE}orgType> "{org_type}" .'
-    ]
-    return triples
+    # Keyed by role too, so an org seen as both publisher and imprint keeps both orgTypes
+    if not _first_emission(f"{org_uri} {org_type}"):
+        return
+    buf.write(f'{org_uri} {_RDF_TYPE} {_C_ORG} .\n')
+    buf.write(f'{org_uri} {_RDFS_LABEL} "{escape_sparql_string(org_name)}" .\n')
+    buf.write(f'{org_uri} {_P_LEGAL_NAME} "{escape_sparql_string(org_name)}" .\n')
+    buf.write(f'{org_uri} {_P_ORG_TYPE} "{org_type}" .\n')
+
+# Keyword patterns for tone inference, checked in order against "name desc".
+# Plain alternations keep the original substring semantics ("fun" matches "funny").
+_TONE_PATTERNS = [
+    ("Dark", re.compile("dark|noir|grim|gritty|shadow")),
+    ("Comedic", re.compile("funny|comedy|humor|laugh|silly")),
+    ("Wholesome", re.compile("adventure|fun|family|friends")),
+]
+_HORROR_PATTERN = re.compile("horror|terror|fear")
+
+# Character name keyword patterns for theme tags (narrative-rec.ttl)
+_CHARACTER_THEME_PATTERNS = [
+    ("Spider-Powers", re.compile("spider|web|arachnid")),
+    ("Dark-Vigilante", re.compile("dark|shadow|night")),
+    ("Superhero", re.compile("super|man|woman|girl|boy")),
+]
+
+# Theme implied by a word in a genre name (narrative-rec.ttl)
+_THEME_BY_GENRE_TOKEN = {
+    "superhero": "Heroism",
+    "fantasy": "Magic",
+    "sci-fi": "Technology",
+    "horror": "Survival",
+    "crime": "Justice",
+    "romance": "Love"
+}
 
 def infer_tone(series_data: dict) -> str:
     """Infer tone from series data using heuristics"""
-    name = series_data.get("name", "").lower()
-    desc = series_data.get("desc", "").lower()
-    genres = [g.get("name", "").lower() for g in series_data.get("genres", [])]
-    
-    # Check for dark/gritty tone
-    if any(word in name + desc for word in ["dark", "noir", "grim", "gritty", "shadow"]):
-        return "Dark"
+    text = series_data.get("name", "").lower() + " " + series_data.get("desc", "").lower()
     
-    # Check for comedic tone
-    if any(word in name + desc for word in ["funny", "comedy", "humor", "laugh", "silly"]):
-        return "Comedic"
-    
-    # Check for wholesome tone
-    if any(word in name + desc for word in ["adventure", "fun", "family", "friends"]):
-        return "Wholesome"
+    # Check for dark/gritty, comedic and wholesome tones
+    for tone, pattern in _TONE_PATTERNS:
+        if pattern.search(text):
+            return tone
     
     # Check for horror
-    if "horror" in genres or any(word in name + desc for word in ["horror", "terror", "fear"]):
+    if any(g.get("name", "").lower() == "horror" for g in series_data.get("genres", [])):
+        return "Dark"
+    if _HORROR_PATTERN.search(text):
         return "Dark"
     
     # Default to Dramatic
     return "Dramatic"
 
-def generate_series_triples(series_id: int, series_data: dict) -> list[str]:
+def generate_series_triples(buf: io.StringIO, series_id: int, series_data: dict) -> None:
     """Generate triples for a StoryWork (series) with narrative-rec.ttl extensions"""
     work_uri = f"<{BASE_URI}work/series_{series_id}>"
-    triples = [
-        f'{work_uri} a <{NAMESPACE}StoryWork> .',
-        f'{work_uri} <http://www.w3.org/2000/01/rdf-schema#label> "{escape_sparql_string(series_data["name"])}" .',
-        f'{work_uri} <{NAMESPACE}seriesName> "{escape_sparql_string(series_data["name"])}" .'
-    ]
-    
-    # Add sortName if available
-    if series_data.get("sort_name"):
-        triples.append(f'{work_uri} <{NAMESPACE}sortName> "{escape_sparql_string(series_data["sort_name"])}" .')
-    
-    # Add volume
-    if series_data.get("volume"):
-        triples.append(f'{work_uri} <{NAMESPACE}volume> "{series_data["volume"]}"^^<http://www.w3.org/2001/XMLSchema#int> .')
+    buf.write(f'{work_uri} {_RDF_TYPE} {_C_STORY_WORK} .\n')
+    buf.write(f'{work_uri} {_RDFS_LABEL} "{escape_sparql_string(series_data["name"])}" .\n')
+    buf.write(f'{work_uri} {_P_SERIES_NAME} "{escape_sparql_string(series_data["name"])}" .\n')
     
-    # Add year began
-    if series_data.get("year_began"):
-        triples.append(f'{work_uri} <{NAMESPACE}yearBegan> "{series_data["year_began"]}"^^<http://www.w3.org/2001/XMLSchema#int> .')
-    
-    # Add year ended if available
-    if series_data.get("year_ended"):
-        triples.append(f'{work_uri} <{NAMESPACE}yearEnded> "{series_data["year_ended"]}"^^<http://www.w3.org/2001/XMLSchema#int> .')
-    
-    # Add issue count if available
-    if series_data.get("count_of_issues"):
-        triples.append(f'{work_uri} <{NAMESPACE}issueCount> "{series_data["count_of_issues"]}"^^<http://www.w3.org/2001/XMLSchema#int> .')
+    # Add sortName, volume, years, issue count and synopsis if available
+    generate_literal_triples(buf, work_uri, series_data, SERIES_FIELDS)
     
     # Add series type
     if "series_type" in series_data and series_data["series_type"]:
-        triples.append(f'{work_uri} <{NAMESPACE}seriesType> "{escape_sparql_string(series_data["series_type"]["name"])}" .')
+        buf.write(f'{work_uri} {_P_SERIES_TYPE} "{escape_sparql_string(series_data["series_type"]["name"])}" .\n')
     
     # Add genres as Genre instances with hasGenre relationships (narrative-rec.ttl)
     if "genres" in series_data:
@@ -135,22 +325,18 @@ def generate_series_triples(series_id: int, series_data: dict) -> list[str]:
             genre_name = genre["name"]
             genre_uri = f'<{BASE_URI}genre/{safe_uri(genre_name)}>'
             # Create Genre instance
-            triples.append(f'{genre_uri} a <{NAMESPACE}Genre> .')
-            triples.append(f'{genre_uri} <http://www.w3.org/2000/01/rdf-schema#label> "{escape_sparql_string(genre_name)}" .')
+            if _first_emission(genre_uri):
+                buf.write(f'{genre_uri} {_RDF_TYPE} {_C_GENRE} .\n')
+                buf.write(f'{genre_uri} {_RDFS_LABEL} "{escape_sparql_string(genre_name)}" .\n')
             # Link work to genre
-            triples.append(f'{work_uri} <{NAMESPACE}hasGenre> {genre_uri} .')
+            buf.write(f'{work_uri} {_P_HAS_GENRE} {genre_uri} .\n')
             # Legacy property for backward compatibility
-            triples.append(f'{work_uri} <{NAMESPACE}genre> "{escape_sparql_string(genre_name)}" .')
+            buf.write(f'{work_uri} {_P_GENRE} "{escape_sparql_string(genre_name)}" .\n')
     
     # Add publisher relationship
     if series_data.get("publisher"):
         pub_uri = f'<{BASE_URI}org/{series_data["publisher"]["id"]}>'
-        triples.append(f'{work_uri} <{NAMESPACE}publishedBy> {pub_uri} .')
-    
-    # Add description/synopsis if available
-    if series_data.get("desc"):
-        desc = escape_sparql_string(series_data["desc"][:1000])  # Limit description length
-        triples.append(f'{work_uri} <{NAMESPACE}synopsis> "{desc}" .')
+        buf.write(f'{work_uri} {_P_PUBLISHED_BY} {pub_uri} .\n')
     
     # Add ranking features from narrative-rec.ttl
     # Generate synthetic popularity score based on issue count and year
@@ -161,50 +347,46 @@ def generate_series_triples(series_id: int, series_data: dict) -> list[str]:
     
     # Popularity: more issues + longer run = higher score
     popularity = min(1.0, (issue_count / 500.0) * (years_active / 20.0))
-    triples.append(f'{work_uri} <{NAMESPACE}popularityScore> "{popularity:.3f}"^^<http://www.w3.org/2001/XMLSchema#float> .')
+    buf.write(f'{work_uri} {_P_POPULARITY_SCORE} "{popularity:.3f}{_FLOAT_LITERAL_END}')
     
     # Trending: recent series get higher scores
     recency_factor = max(0.0, 1.0 - (current_year - year_began) / 50.0)
     trending = min(1.0, recency_factor * (issue_count / 100.0))
-    triples.append(f'{work_uri} <{NAMESPACE}trendingScore> \"{trending:.3f}\"^^<http://www.w3.org/2001/XMLSchema#float> .')
+    buf.write(f'{work_uri} {_P_TRENDING_SCORE} "{trending:.3f}{_FLOAT_LITERAL_END}')
     
     # Completion rate: estimate based on series status
     completion_rate = 0.7  # Default
     if series_data.get("year_ended"):
         completion_rate = 0.85  # Completed series have higher completion
-    triples.append(f'{work_uri} <{NAMESPACE}completionRate> \"{completion_rate:.2f}\"^^<http://www.w3.org/2001/XMLSchema#float> .')
+    buf.write(f'{work_uri} {_P_COMPLETION_RATE} "{completion_rate:.2f}{_FLOAT_LITERAL_END}')
     
     # Engagement score: combination of multiple factors
     engagement = min(1.0, (popularity + trending) / 2.0)
-    triples.append(f'{work_uri} <{NAMESPACE}engagementScore> \"{engagement:.3f}\"^^<http://www.w3.org/2001/XMLSchema#float> .')
+    buf.write(f'{work_uri} {_P_ENGAGEMENT_SCORE} "{engagement:.3f}{_FLOAT_LITERAL_END}')
     
     # Add tone (narrative-rec.ttl)
     tone_value = infer_tone(series_data)
     tone_uri = f'<{BASE_URI}tone/{safe_uri(tone_value)}>'
-    triples.append(f'{tone_uri} a <{NAMESPACE}Tone> .')
-    triples.append(f'{tone_uri} <http://www.w3.org/2000/01/rdf-schema#label> \"{tone_value}\" .')
-    triples.append(f'{work_uri} <{NAMESPACE}hasTone> {tone_uri} .')
-    
-    # Add themes based on genre (narrative-rec.ttl)
-    genre_to_theme = {
-        "superhero": "Heroism",
-        "fantasy": "Magic",
-        "sci-fi": "Technology",
-        "horror": "Survival",
-        "crime": "Justice",
-        "romance": "Love"
+    if _first_emission(tone_uri):
+        buf.write(f'{tone_uri} {_RDF_TYPE} {_C_TONE} .\n')
+        buf.write(f'{tone_uri} {_RDFS_LABEL} \"{tone_value}\" .\n')
+    buf.write(f'{work_uri} {_P_HAS_TONE} {tone_uri} .\n')
+    
+    # Add themes based on genre (narrative-rec.ttl), once per theme even if
+    # several genres map to it
+    themes = {
+        _THEME_BY_GENRE_TOKEN[token]
+        for genre in series_data.get("genres", [])
+        for token in genre.get("name", "").lower().split()
+        if token in _THEME_BY_GENRE_TOKEN
     }
     
-    for genre in series_data.get("genres", []):
-        genre_lower = genre.get("name", "").lower()
-        for genre_key, theme_name in genre_to_theme.items():
-            if genre_key in genre_lower:
-                theme_uri = f'<{BASE_URI}theme/{safe_uri(theme_name)}>'
-                triples.append(f'{theme_uri} a <{NAMESPACE}Theme> .')
-                triples.append(f'{theme_uri} <http://www.w3.org/2000/01/rdf-schema#label> \"{theme_name}\" .')
-                triples.append(f'{work_uri} <{NAMESPACE}hasTheme> {theme_uri} .')
-    
-    return triples
+    for theme_name in sorted(themes):
+        theme_uri = f'<{BASE_URI}theme/{safe_uri(theme_name)}>'
+        if _first_emission(theme_uri):
+            buf.write(f'{theme_uri} {_RDF_TYPE} {_C_THEME} .\n')
+            buf.write(f'{theme_uri} {_RDFS_LABEL} \"{theme_name}\" .\n')
+        buf.write(f'{work_uri} {_P_HAS_THEME} {theme_uri} .\n')
 
 def infer_format_class(issue_data: dict) -> str:
     """Infer format class from issue data"""
@@ -224,113 +406,67 @@ def infer_format_class(issue_data: dict) -> str:
     else:
         return "SingleIssue"
 
-def generate_issue_triples(issue_data: dict) -> list[str]:
+def generate_issue_triples(buf: io.StringIO, issue_data: dict) -> None:
     """Generate triples for a StoryExpression (issue) with narrative-rec.ttl extensions"""
     issue_id = issue_data["id"]
     expr_uri = f"<{BASE_URI}expression/issue_{issue_id}>"
     
-    triples = [
-        f'{expr_uri} a <{NAMESPACE}StoryExpression> .'
-    ]
+    buf.write(f'{expr_uri} {_RDF_TYPE} {_C_STORY_EXPRESSION} .\n')
     
-    # Add issue name/title
+    # Add issue name/title as label
     if issue_data.get("issue_name"):
-        triples.append(f'{expr_uri} <http://www.w3.org/2000/01/rdf-schema#label> "{escape_sparql_string(issue_data["issue_name"])}" .')
-        triples.append(f'{expr_uri} <{NAMESPACE}issueTitle> "{escape_sparql_string(issue_data["issue_name"])}" .')
-    
-    # Add issue number
-    if issue_data.get("number"):
-        triples.append(f'{expr_uri} <{NAMESPACE}issueNumber> "{escape_sparql_string(issue_data["number"])}" .')
-    
-    # Add cover date
-    if issue_data.get("cover_date"):
-        triples.append(f'{expr_uri} <{NAMESPACE}coverDate> "{issue_data["cover_date"]}"^^<http://www.w3.org/2001/XMLSchema#date> .')
-    
-    # Add store date
-    if issue_data.get("store_date"):
-        triples.append(f'{expr_uri} <{NAMESPACE}storeDate> "{issue_data["store_date"]}"^^<http://www.w3.org/2001/XMLSchema#date> .')
-    
-    # Add MSRP (price)
-    if issue_data.get("price"):
-        triples.append(f'{expr_uri} <{NAMESPACE}msrp> "{issue_data["price"]}"^^<http://www.w3.org/2001/XMLSchema#decimal> .')
+        buf.write(f'{expr_uri} {_RDFS_LABEL} "{escape_sparql_string(issue_data["issue_name"])}" .\n')
     
-    # Add page count
-    if issue_data.get("page_count"):
-        triples.append(f'{expr_uri} <{NAMESPACE}pageCount> "{issue_data["page_count"]}"^^<http://www.w3.org/2001/XMLSchema#int> .')
-    
-    # Add description
-    if issue_data.get("desc"):
-        desc = escape_sparql_string(issue_data["desc"][:1000])  # Limit description length
-        triples.append(f'{expr_uri} <{NAMESPACE}description> "{desc}" .')
-    
-    # Add SKU
-    if issue_data.get("sku"):
-        triples.append(f'{expr_uri} <{NAMESPACE}sku> "{escape_sparql_string(issue_data["sku"])}" .')
-    
-    # Add UPC
-    if issue_data.get("upc"):
-        triples.append(f'{expr_uri} <{NAMESPACE}upc> "{escape_sparql_string(issue_data["upc"])}" .')
-
-    # Add image/cover
-    if issue_data.get("image"):
-        triples.append(f'{expr_uri} <{NAMESPACE}coverImage> "{escape_sparql_string(issue_data["image"])}"^^<http://www.w3.org/2001/XMLSchema#anyURI> .')
-    
-    # Add ISBN if available
-    if issue_data.get("isbn"):
-        triples.append(f'{expr_uri} <{NAMESPACE}isbn> "{escape_sparql_string(issue_data["isbn"])}" .')
+    # Add title, number, dates, price, page count, description, identifiers and cover
+    generate_literal_triples(buf, expr_uri, issue_data, ISSUE_FIELDS)
     
     # Link to series (StoryWork)
     if "series" in issue_data and issue_data["series"]:
         work_uri = f'<{BASE_URI}work/series_{issue_data["series"]["id"]}>'
-        triples.append(f'{expr_uri} <{NAMESPACE}expressionOf> {work_uri} .')
-        triples.append(f'{work_uri} <{NAMESPACE}hasExpression> {expr_uri} .')
+        buf.write(f'{expr_uri} {_P_EXPRESSION_OF} {work_uri} .\n')
+        buf.write(f'{work_uri} {_P_HAS_EXPRESSION} {expr_uri} .\n')
     
     # Link to publisher
     if "publisher" in issue_data and issue_data["publisher"]:
         pub_uri = f'<{BASE_URI}org/{issue_data["publisher"]["id"]}>'
-        triples.append(f'{expr_uri} <{NAMESPACE}publishedBy> {pub_uri} .')
+        buf.write(f'{expr_uri} {_P_PUBLISHED_BY} {pub_uri} .\n')
     
     # Create Manifestation and link format class (narrative-rec.ttl)
     # Each issue is also a Manifestation (physical/digital product)
     manif_uri = f"<{BASE_URI}manifestation/issue_{issue_id}>"
-    triples.append(f'{manif_uri} a <{NAMESPACE}Manifestation> .')
-    triples.append(f'{expr_uri} <{NAMESPACE}hasManifestation> {manif_uri} .')
-    triples.append(f'{manif_uri} <{NAMESPACE}manifestationOf> {expr_uri} .')
+    buf.write(f'{manif_uri} {_RDF_TYPE} {_C_MANIFESTATION} .\n')
+    buf.write(f'{expr_uri} {_P_HAS_MANIFESTATION} {manif_uri} .\n')
+    buf.write(f'{manif_uri} {_P_MANIFESTATION_OF} {expr_uri} .\n')
     
     # Add format class
     format_class = infer_format_class(issue_data)
     format_uri = f'<{BASE_URI}format/{safe_uri(format_class)}>'
-    triples.append(f'{format_uri} a <{NAMESPACE}FormatClass> .')
-    triples.append(f'{format_uri} <http://www.w3.org/2000/01/rdf-schema#label> \"{format_class}\" .')
-    triples.append(f'{manif_uri} <{NAMESPACE}hasFormatClass> {format_uri} .')
-    
-    return triples
+    if _first_emission(format_uri):
+        buf.write(f'{format_uri} {_RDF_TYPE} {_C_FORMAT_CLASS} .\n')
+        buf.write(f'{format_uri} {_RDFS_LABEL} \"{format_class}\" .\n')
+    buf.write(f'{manif_uri} {_P_HAS_FORMAT_CLASS} {format_uri} .\n')
 
-def generate_credit_triples(issue_id: int, credit: dict, credit_index: int) -> list[str]:
+def generate_credit_triples(buf: io.StringIO, issue_id: int, credit: dict, credit_index: int) -> None:
     """Generate triples for a CreditRelationship"""
     credit_uri = f"<{BASE_URI}credit/{issue_id}_{credit['id']}_{credit_index}>"
     person_uri = f"<{BASE_URI}person/{credit['id']}>"
     expr_uri = f"<{BASE_URI}expression/issue_{issue_id}>"
     
-    triples = [
-        f'{credit_uri} a <{NAMESPACE}CreditRelationship> .',
-        f'{person_uri} <{NAMESPACE}hasCreditRelationship> {credit_uri} .',
-        f'{credit_uri} <{NAMESPACE}creditsExpression> {expr_uri} .',
-        f'{credit_uri} <{NAMESPACE}creditedName> "{escape_sparql_string(credit["creator"])}" .',
-        f'{credit_uri} <{NAMESPACE}billingOrder> "{credit_index}"^^<http://www.w3.org/2001/XMLSchema#int> .'
-    ]
+    buf.write(f'{credit_uri} {_RDF_TYPE} {_C_CREDIT_RELATIONSHIP} .\n')
+    buf.write(f'{person_uri} {_P_HAS_CREDIT_RELATIONSHIP} {credit_uri} .\n')
+    buf.write(f'{credit_uri} {_P_CREDITS_EXPRESSION} {expr_uri} .\n')
+    buf.write(f'{credit_uri} {_P_CREDITED_NAME} "{escape_sparql_string(credit["creator"])}" .\n')
+    buf.write(f'{credit_uri} {_P_BILLING_ORDER} "{credit_index}{_INT_LITERAL_END}')
     
     # Add roles
     for role_data in credit.get("role", []):
         role_name = role_data["name"]
         # Map to ontology Role subclasses where possible
         role_uri = f'<{NAMESPACE}{safe_uri(role_name)}>'
-        triples.append(f'{credit_uri} <{NAMESPACE}creditRole> {role_uri} .')
-        triples.append(f'{credit_uri} <{BASE_URI}roleName> "{escape_sparql_string(role_name)}" .')
-    
-    return triples
+        buf.write(f'{credit_uri} {_P_CREDIT_ROLE} {role_uri} .\n')
+        buf.write(f'{credit_uri} {_P_ROLE_NAME} "{escape_sparql_string(role_name)}" .\n')
 
-def generate_character_triples(char_data: dict, series_id: int, issue_id: int = None) -> list[str]:
+def generate_character_triples(buf: io.StringIO, char_data: dict, series_id: int, issue_id: int = None) -> None:
     """Generate triples for a Character"""
     char_id = char_data.get("id", "")
     if not char_id:
@@ -338,266 +474,272 @@ def generate_character_triples(char_data: dict, series_id: int, issue_id: int =
         char_id = safe_uri(char_data["name"])
     
     char_uri = f"<{BASE_URI}character/{char_id}>"
-    triples = [
-        f'{char_uri} a <{NAMESPACE}Character> .',
-        f'{char_uri} <http://www.w3.org/2000/01/rdf-schema#label> "{escape_sparql_string(char_data["name"])}" .',
-        f'{char_uri} <{NAMESPACE}characterName> "{escape_sparql_string(char_data["name"])}" .'
-    ]
+    buf.write(f'{char_uri} {_RDF_TYPE} {_C_CHARACTER} .\n')
+    buf.write(f'{char_uri} {_RDFS_LABEL} "{escape_sparql_string(char_data["name"])}" .\n')
+    buf.write(f'{char_uri} {_P_CHARACTER_NAME} "{escape_sparql_string(char_data["name"])}" .\n')
     
-    # Add real name if available
-    if char_data.get("real_name"):
-        triples.append(f'{char_uri} <{NAMESPACE}realName> "{escape_sparql_string(char_data["real_name"])}" .')
+    # Add real name, origin, powers and bio if available
+    generate_literal_triples(buf, char_uri, char_data, CHARACTER_FIELDS)
     
     # Add aliases if available
     if char_data.get("aliases"):
         # Can be string or list
         aliases = char_data["aliases"]
         if isinstance(aliases, str):
-            triples.append(f'{char_uri} <{NAMESPACE}aliases> "{escape_sparql_string(aliases)}" .')
+            buf.write(f'{char_uri} {_P_ALIASES} "{escape_sparql_string(aliases)}" .\n')
         elif isinstance(aliases, list):
             for alias in aliases:
-                triples.append(f'{char_uri} <{NAMESPACE}aliases> "{escape_sparql_string(alias)}" .')
-    
-    # Add origin if available
-    if char_data.get("origin"):
-        origin = escape_sparql_string(char_data["origin"][:500])
-        triples.append(f'{char_uri} <{NAMESPACE}origin> "{origin}" .')
-    
-    # Add powers if available
-    if char_data.get("powers"):
-        powers = escape_sparql_string(char_data["powers"][:1000])
-        triples.append(f'{char_uri} <{NAMESPACE}powers> "{powers}" .')
-    
-    # Add description/bio if available
-    if char_data.get("desc"):
-        bio = escape_sparql_string(char_data["desc"][:1000])
-        triples.append(f'{char_uri} <{NAMESPACE}bio> "{bio}" .')
+                buf.write(f'{char_uri} {_P_ALIASES} "{escape_sparql_string(alias)}" .\n')
     
     # Mark first appearance if this is their debut issue
     if issue_id and char_data.get("first_appeared_in_issue"):
         if str(char_data["first_appeared_in_issue"].get("id")) == str(issue_id):
             expr_uri = f'<{BASE_URI}expression/issue_{issue_id}>'
-            triples.append(f'{char_uri} <{NAMESPACE}firstAppearanceIn> {expr_uri} .')
-            triples.append(f'{expr_uri} <{NAMESPACE}firstAppearance> {char_uri} .')
+            buf.write(f'{char_uri} {_P_FIRST_APPEARANCE_IN} {expr_uri} .\n')
+            buf.write(f'{expr_uri} {_P_FIRST_APPEARANCE} {char_uri} .\n')
     
     # Link to series/work as franchise
     if series_id:
         work_uri = f'<{BASE_URI}work/series_{series_id}>'
-        triples.append(f'{char_uri} <{NAMESPACE}belongsToFranchise> {work_uri} .')
+        buf.write(f'{char_uri} {_P_BELONGS_TO_FRANCHISE} {work_uri} .\n')
     
     # Generate tags for character themes (narrative-rec.ttl)
     # Extract themes from character name patterns
     char_name_lower = char_data["name"].lower()
-    themes = []
-    
-    if any(word in char_name_lower for word in ["spider", "web", "arachnid"]):
-        themes.append("Spider-Powers")
-    if any(word in char_name_lower for word in ["dark", "shadow", "night"]):
-        themes.append("Dark-Vigilante")
-    if any(word in char_name_lower for word in ["super", "man", "woman", "girl", "boy"]):
-        themes.append("Superhero")
+    themes = [theme for theme, pattern in _CHARACTER_THEME_PATTERNS if pattern.search(char_name_lower)]
     
     for theme_name in themes:
         tag_uri = f'<{BASE_URI}tag/{safe_uri(theme_name)}>'
-        triples.append(f'{tag_uri} a <{NAMESPACE}Tag> .')
-        triples.append(f'{tag_uri} <http://www.w3.org/2000/01/rdf-schema#label> "{theme_name}" .')
-    
-    return triples
+        if _first_emission(tag_uri):
+            buf.write(f'{tag_uri} {_RDF_TYPE} {_C_TAG} .\n')
+            buf.write(f'{tag_uri} {_RDFS_LABEL} "{theme_name}" .\n')
 
-def generate_group_triples(team_data: dict) -> list[str]:
+def generate_group_triples(buf: io.StringIO, team_data: dict) -> None:
     """Generate triples for a Group (team)"""
     team_id = team_data.get("id", safe_uri(team_data["name"]))
     team_uri = f"<{BASE_URI}group/{team_id}>"
     
-    triples = [
-        f'{team_uri} a <{NAMESPACE}Group> .',
-        f'{team_uri} <http://www.w3.org/2000/01/rdf-schema#label> "{escape_sparql_string(team_data["name"])}" .',
-        f'{team_uri} <{NAMESPACE}groupName> "{escape_sparql_string(team_data["name"])}" .'
-    ]
+    buf.write(f'{team_uri} {_RDF_TYPE} {_C_GROUP} .\n')
+    buf.write(f'{team_uri} {_RDFS_LABEL} "{escape_sparql_string(team_data["name"])}" .\n')
+    buf.write(f'{team_uri} {_P_GROUP_NAME} "{escape_sparql_string(team_data["name"])}" .\n')
     
     # Add group type (default to team)
-    triples.append(f'{team_uri} <{NAMESPACE}groupType> "Hero Team" .')
+    buf.write(f'{team_uri} {_P_GROUP_TYPE} "Hero Team" .\n')
     
     # Add description if available
-    if team_data.get("desc"):
-        desc = escape_sparql_string(team_data["desc"][:1000])
-        triples.append(f'{team_uri} <{NAMESPACE}purpose> "{desc}" .')
-    
-    return triples
+    generate_literal_triples(buf, team_uri, team_data, GROUP_FIELDS)
 
-def generate_universe_triples(universe_data: dict) -> list[str]:
+def generate_universe_triples(buf: io.StringIO, universe_data: dict) -> None:
     """Generate triples for a Universe"""
     univ_id = universe_data.get("id", safe_uri(universe_data.get("name", "")))
     if not univ_id or not universe_data.get("name"):
-        return []
+        return
     
     univ_uri = f"<{BASE_URI}universe/{univ_id}>"
-    triples = [
-        f'{univ_uri} a <{NAMESPACE}Universe> .',
-        f'{univ_uri} <http://www.w3.org/2000/01/rdf-schema#label> "{escape_sparql_string(universe_data["name"])}" .',
-        f'{univ_uri} <{NAMESPACE}universeName> "{escape_sparql_string(universe_data["name"])}" .'
-    ]
+    buf.write(f'{univ_uri} {_RDF_TYPE} {_C_UNIVERSE} .\n')
+    buf.write(f'{univ_uri} {_RDFS_LABEL} "{escape_sparql_string(universe_data["name"])}" .\n')
+    buf.write(f'{univ_uri} {_P_UNIVERSE_NAME} "{escape_sparql_string(universe_data["name"])}" .\n')
     
     # Add designation if it looks like one (Earth-616, etc.)
     name = universe_data["name"]
     if "earth" in name.lower() or "universe" in name.lower():
-        triples.append(f'{univ_uri} <{NAMESPACE}designation> "{escape_sparql_string(name)}" .')
+        buf.write(f'{univ_uri} {_P_DESIGNATION} "{escape_sparql_string(name)}" .\n')
     
     # Add description if available
-    if universe_data.get("desc"):
-        desc = escape_sparql_string(universe_data["desc"][:1000])
-        triples.append(f'{univ_uri} <{NAMESPACE}universeDescription> "{desc}" .')
-    
-    return triples
+    generate_literal_triples(buf, univ_uri, universe_data, UNIVERSE_FIELDS)
 
-def process_issue(issue: dict) -> Iterator[str]:
-    """Process a single issue and yield SPARQL INSERT statements"""
+def process_issue(issue: dict, output_format: str = "sparql") -> str:
+    """Process a single issue into a SPARQL INSERT DATA block or N-Triples lines (empty if it has no triples)"""
     issue_id = issue["id"]
     
-    # Generate all triples for this issue
-    all_triples = []
+    # Write all triples for this issue into one buffer
+    buf = io.StringIO()
     
     # 1. Publisher/Imprint orgs
     if "publisher" in issue and issue["publisher"]:
         pub = issue["publisher"]
-        all_triples.extend(generate_org_triples(pub["id"], pub["name"], "Publisher"))
+        generate_org_triples(buf, pub["id"], pub["name"], "Publisher")
     
     if "imprint" in issue and issue["imprint"]:
         imp = issue["imprint"]
-        all_triples.extend(generate_org_triples(imp["id"], imp["name"], "Imprint"))
+        generate_org_triples(buf, imp["id"], imp["name"], "Imprint")
     
     # 2. Series (StoryWork)
     if "series" in issue and issue["series"]:
-        all_triples.extend(generate_series_triples(issue["series"]["id"], issue["series"]))
+        generate_series_triples(buf, issue["series"]["id"], issue["series"])
     
     # 3. Issue (StoryExpression)
-    all_triples.extend(generate_issue_triples(issue))
+    generate_issue_triples(buf, issue)
     
     # 4. Credits (CreditRelationship + Person)
     for idx, credit in enumerate(issue.get("credits", [])):
-        all_triples.extend(generate_person_triples(credit["id"], credit["creator"]))
-        all_triples.extend(generate_credit_triples(issue_id, credit, idx))
+        generate_person_triples(buf, credit["id"], credit["creator"])
+        generate_credit_triples(buf, issue_id, credit, idx)
     
     # 5. Characters
     for char in issue.get("characters", []):
         series_id = issue["series"]["id"] if "series" in issue and issue["series"] else None
-        all_triples.extend(generate_character_triples(char, series_id, issue_id))
+        generate_character_triples(buf, char, series_id, issue_id)
     
     # 6. Teams (treat as Groups)
     for team in issue.get("teams", []):
-        all_triples.extend(generate_group_triples(team))
+        generate_group_triples(buf, team)
     
     # 7. Universes
     for universe in issue.get("universes", []):
-        all_triples.extend(generate_universe_triples(universe))
+        generate_universe_triples(buf, universe)
     
-    # Yield as INSERT DATA block
-    if all_triples:
-        yield "INSERT DATA {\n"
-        for triple in all_triples:
-            yield f"  {triple}\n"
-        yield "} ;\n\n"
+    triples = buf.getvalue()
+    if not triples:
+        return ""
+    if output_format == "nt":
+        return triples
+    return f"INSERT DATA {{\n{triples}}} ;\n\n"
 
-def stream_json_array(file_handle: TextIO, limit: int = None) -> Iterator[dict]:
-    """Stream JSON array items without loading entire file into memory"""
+def _stream_json_array_fallback(file_handle: BinaryIO, limit: int = None) -> Iterator[dict]:
+    """Stream JSON array items with a pure-Python scanner (used when ijson is unavailable)"""
     count = 0
-    # Skip opening bracket
-    line = file_handle.readline()
-    if not line.strip().startswith('['):
+    first = file_handle.read(READ_CHUNK_SIZE)
+    if not first.lstrip().startswith(b'['):
         raise ValueError("Expected JSON array")
     
-    buffer = ""
+    # Bytes of the object currently being scanned, carried across chunk reads
+    buf = bytearray()
     brace_depth = 0
     in_string = False
-    escape_next = False
-    
-    for line in file_handle:
-        for char in line:
-            if escape_next:
-                buffer += char
-                escape_next = False
+    # Chunk offset of the byte following a backslash inside a string
+    escaped_at = -1
+    
+    chunk = first
+    while chunk:
+        # Offset in this chunk where the pending object's bytes begin
+        start = 0
+        # Only braces, quotes and backslashes affect the scanner state; the
+        # regex skips every other byte in C
+        for match in _JSON_STRUCTURAL.finditer(chunk):
+            i = match.start()
+            if i == escaped_at:
                 continue
-            
-            if char == '\\' and in_string:
-                escape_next = True
-                buffer += char
-                continue
-            
-            if char == '"' and not escape_next:
-                in_string = not in_string
-            
-            if not in_string:
-                if char == '{':
-                    brace_depth += 1
-                elif char == '}':
-                    brace_depth -= 1
-            
-            buffer += char
-            
-            # Complete object
-            if brace_depth == 0 and buffer.strip() and not in_string:
-                obj_str = buffer.strip().rstrip(',')
-                if obj_str and obj_str != ']':
+            byte = chunk[i]
+            if in_string:
+                if byte == 0x5C:  # backslash
+                    escaped_at = i + 1
+                elif byte == 0x22:  # closing quote
+                    in_string = False
+            elif byte == 0x22:  # opening quote
+                in_string = True
+            elif byte == 0x7B:  # {
+                if brace_depth == 0:
+                    start = i
+                brace_depth += 1
+            elif byte == 0x7D:  # }
+                brace_depth -= 1
+                if brace_depth == 0:
+                    # Complete object
+                    buf.extend(chunk[start:i + 1])
                     try:
-                        obj = json.loads(obj_str)
+                        obj = json.loads(buf.decode('utf-8'))
                         yield obj
                         count += 1
                         if limit and count >= limit:
                             return
-                    except json.JSONDecodeError as e:
+                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
                         print(f"Warning: Failed to parse object: {e}", file=sys.stderr)
-                buffer = ""
+                    buf = bytearray()
+        
+        if brace_depth > 0:
+            buf.extend(chunk[start:])
+        # A backslash at the very end escapes the first byte of the next chunk
+        escaped_at -= len(chunk)
+        chunk = file_handle.read(READ_CHUNK_SIZE)
+
+def stream_json_array(file_handle: BinaryIO, limit: int = None) -> Iterator[dict]:
+    """Stream JSON array items without loading entire file into memory (expects a binary file)"""
+    if ijson is None:
+        yield from _stream_json_array_fallback(file_handle, limit)
+        return
+    
+    items = ijson.items(file_handle, 'item', use_float=True)
+    yield from islice(items, limit) if limit else items
 
 def main():
     import argparse
     
-    parser = argparse.ArgumentParser(description="Convert comic JSON to SPARQL INSERT statements")
+    parser = argparse.ArgumentParser(
+        description="Convert comic JSON to SPARQL INSERT statements or N-Triples",
+        epilog="Shared entities (people, orgs, genres, tones, themes, format classes, tags) "
+               "are described only in the first block that mentions them; later blocks just "
+               "link to them. Load the whole output: if a block fails to load, those entities "
+               "lose their type and label triples. seed_helper.py exits non-zero in that case."
+    )
     parser.add_argument("input_file", help="Path to comic_output.json")
-    parser.add_argument("-o", "--output", help="Output SPARQL file (default: stdout)")
+    parser.add_argument("-o", "--output", help="Output SPARQL/N-Triples file (default: stdout)")
+    parser.add_argument("-f", "--format", "--output-format", dest="output_format",
+                        choices=OUTPUT_FORMATS, default="sparql",
+                        help="Emit SPARQL INSERT DATA blocks or N-Triples for bulk loading (default: sparql)")
     parser.add_argument("-l", "--limit", type=int, help="Limit number of issues to process")
     parser.add_argument("-s", "--skip", type=int, default=0, help="Skip first N issues")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for triple generation (default: CPU count)")
     
     args = parser.parse_args()
     
-    output_file = open(args.output, 'w') if args.output else sys.stdout
+    output_file = open(args.output, 'wb', buffering=WRITE_BUFFER_SIZE) if args.output else sys.stdout.buffer
     
     try:
-        with open(args.input_file, 'r', encoding='utf-8') as f:
-            # Write SPARQL header
-            output_file.write(f"# SPARQL INSERT statements generated from {args.input_file}\n")
-            output_file.write(f"# Namespace: {NAMESPACE}\n")
-            output_file.write(f"# Base URI: {BASE_URI}\n\n")
+        with open(args.input_file, 'rb') as f:
+            # Write header (comments are valid in both SPARQL and N-Triples)
+            kind = "N-Triples" if args.output_format == "nt" else "SPARQL INSERT statements"
+            output_file.write((
+                f"# {kind} generated from {args.input_file}\n"
+                f"# Namespace: {NAMESPACE}\n"
+                f"# Base URI: {BASE_URI}\n\n"
+            ).encode('utf-8'))
             
             issue_count = 0
-            skipped = 0
-            sparql_buffer = []
+            # Blocks are written as they arrive; only the latest is held back so
+            # the final statement can be written without its trailing semicolon
+            last_block = None
+            issues = islice(stream_json_array(f, args.limit), args.skip, None)
+            convert = partial(process_issue, output_format=args.output_format)
             
-            for issue in stream_json_array(f, args.limit):
-                if skipped < args.skip:
-                    skipped += 1
-                    continue
-                
-                issue_count += 1
-                
-                # Process and collect SPARQL for this issue
-                for sparql_line in process_issue(issue):
-                    sparql_buffer.append(sparql_line)
+            # Issues are independent, so blocks are generated in parallel and
+            # written in completion order
+            pool = multiprocessing.Pool(args.jobs) if args.jobs > 1 else None
+            try:
+                if pool:
+                    blocks = pool.imap_unordered(convert, issues, chunksize=POOL_CHUNK_SIZE)
+                else:
+                    blocks = map(convert, issues)
                 
-                # Progress indicator
-                if issue_count % 100 == 0:
-                    print(f"Processed {issue_count} issues...", file=sys.stderr)
+                for block in blocks:
+                    issue_count += 1
+                    
+                    if block:
+                        if last_block:
+                            output_file.write(last_block.encode('utf-8'))
+                        last_block = block
+                    
+                    # Progress indicator
+                    if issue_count % 100 == 0:
+                        print(f"Processed {issue_count} issues...", file=sys.stderr)
+            finally:
+                if pool:
+                    pool.terminate()
             
-            # Write all SPARQL, removing the trailing semicolon from the last statement
-            if sparql_buffer:
-                sparql_text = ''.join(sparql_buffer).rstrip()
-                if sparql_text.endswith(';'):
-                    sparql_text = sparql_text[:-1]
-                output_file.write(sparql_text + '\n')
+            # Write the last block, removing the trailing semicolon from the last statement
+            if last_block:
+                last_block = last_block.rstrip()
+                if last_block.endswith(';'):
+                    last_block = last_block[:-1]
+                output_file.write((last_block + '\n').encode('utf-8'))
             
             print(f"\nTotal issues processed: {issue_count}", file=sys.stderr)
     
     finally:
-        if output_file != sys.stdout:
+        if output_file is sys.stdout.buffer:
+            output_file.flush()
+        else:
             output_file.close()
 
 if __name__ == "__main__":
@@ -4,17 +4,36 @@
 import sys
 import requests
 import time
-import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 ENDPOINT = "http://localhost:9999/blazegraph/sparql"
 
+# Concurrent update requests sent to Blazegraph by load_sparql
+MAX_WORKERS = 8
+
+# INSERT DATA blocks combined into a single update request; a failed request
+# loses this many blocks, so keep it moderate
+BATCH_SIZE = 200
+
+# One keep-alive session for every request to Blazegraph, sized for the
+# load_sparql worker threads and retrying transient connection failures
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(
+    pool_connections=MAX_WORKERS * 2,
+    pool_maxsize=MAX_WORKERS * 2,
+    max_retries=Retry(total=3, backoff_factor=0.1)
+))
+
 def load_ttl(file_path):
     """Load a TTL file"""
     print(f"Loading {file_path}...")
     with open(file_path, 'rb') as f:
         data = f.read()
     
-    response = requests.post(
+    response = _SESSION.post(
         ENDPOINT,
         data=data,
         headers={'Content-Type': 'application/x-turtle'},
@@ -28,36 +47,96 @@ def load_ttl(file_path):
         print(f"❌ Failed: {response.status_code}")
         return False
 
+def load_nt(file_path):
+    """Load an N-Triples file through Blazegraph's bulk RDF loader"""
+    print(f"Loading {file_path}...")
+    with open(file_path, 'rb') as f:
+        # Stream the file body instead of reading it into memory; the charset
+        # is explicit as older N-Triples parsers assume US-ASCII
+        response = _SESSION.post(
+            ENDPOINT,
+            data=f,
+            headers={'Content-Type': 'application/n-triples; charset=UTF-8'},
+            timeout=3600
+        )
+    
+    if response.status_code in [200, 204]:
+        print(f"✓ Loaded successfully")
+        return True
+    else:
+        print(f"❌ Failed: {response.status_code}")
+        return False
+
+def iter_blocks(file_path):
+    """Yield INSERT DATA blocks from a SPARQL file one at a time"""
+    block = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            # Skip comments and blank lines between blocks
+            if not block and not line.startswith('INSERT DATA {'):
+                continue
+            block.append(line)
+            # Blocks end with "} ;", or a bare "}" for the final statement
+            if line.strip() in ('} ;', '}'):
+                yield ''.join(block).strip()
+                block = []
+    if block:
+        yield ''.join(block).strip()
+
+def iter_batches(blocks):
+    """Group blocks into multi-statement updates ("INSERT DATA {...} ; INSERT DATA {...}")"""
+    blocks = iter(blocks)
+    while True:
+        batch = list(islice(blocks, BATCH_SIZE))
+        if not batch:
+            return
+        yield len(batch), " ;\n".join(b.rstrip(';').rstrip() for b in batch)
+
 def load_sparql(file_path):
     """Load SPARQL file in chunks"""
     print(f"Loading {file_path}...")
     
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    # Split by INSERT DATA blocks
-    blocks = re.split(r'(?=INSERT DATA \{)', content)
-    blocks = [b.strip() for b in blocks if b.strip() and b.strip().startswith('INSERT')]
-    
-    total = len(blocks)
-    print(f"Found {total} blocks to load")
+    total = 0
     success = 0
+    done = 0
+    # In-flight requests: future -> (batch number, block count)
+    pending = {}
     
-    for i, block in enumerate(blocks, 1):
-        if i % 10 == 0:
-            print(f"  Progress: {i}/{total}")
-        
-        try:
-            response = requests.post(
+    def collect(futures):
+        nonlocal success, done
+        for future in futures:
+            number, count = pending.pop(future)
+            done += count
+            print(f"  Progress: {done} blocks processed")
+            
+            try:
+                response = future.result()
+                if response.status_code in [200, 204]:
+                    success += count
+                else:
+                    print(f"  Warning: Batch {number} failed: {response.status_code}")
+            except Exception as e:
+                print(f"  Warning: Batch {number} failed: {e}")
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # The file is read as batches are sent, keeping at most a few batches
+        # per worker in memory
+        for number, (count, batch) in enumerate(iter_batches(iter_blocks(file_path)), 1):
+            if len(pending) >= MAX_WORKERS * 2:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(finished)
+            
+            total += count
+            future = executor.submit(
+                _SESSION.post,
                 ENDPOINT,
-                data=block.encode('utf-8'),
+                data=batch.encode('utf-8'),
                 headers={'Content-Type': 'application/sparql-update'},
-                timeout=60
+                timeout=300
             )
-            if response.status_code in [200, 204]:
-                success += 1
-        except Exception as e:
-            print(f"  Warning: Block {i} failed: {e}")
+            pending[future] = (number, count)
+        
+        collect(as_completed(list(pending)))
     
     print(f"✓ Loaded {success}/{total} blocks")
     return success == total
@@ -65,7 +144,7 @@ def load_sparql(file_path):
 def show_stats():
     """Show triple count"""
     query = "SELECT (COUNT(*) as ?count) WHERE { ?s ?p ?o }"
-    response = requests.get(
+    response = _SESSION.get(
         ENDPOINT,
         params={'query': query},
         headers={'Accept': 'application/sparql-results+json'},
@@ -78,14 +157,23 @@ def show_stats():
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: seed_helper.py [load-ttl|load-sparql|stats] [file]")
+        print("Usage: seed_helper.py [load-ttl|load-nt|load-sparql|stats] [file]")
         sys.exit(1)
     
     command = sys.argv[1]
     
+    ok = True
+    # Fail the seeding when anything did not load: shared entities are only
+    # described in the first block that mentions them, so a lost batch would
+    # otherwise leave later issues linking to untyped, unlabeled resources
     if command == "load-ttl":
-        load_ttl(sys.argv[2])
+        ok = load_ttl(sys.argv[2])
+    elif command == "load-nt":
+        ok = load_nt(sys.argv[2])
     elif command == "load-sparql":
-        load_sparql(sys.argv[2])
+        ok = load_sparql(sys.argv[2])
     elif command == "stats":
-        show_stats()
\ No newline at end of file
+        show_stats()
+    
+    if not ok:
+        sys.exit(1)
\ No newline at end of file